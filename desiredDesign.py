@@ -1,24 +1,76 @@
 from PySide6 import QtWidgets, QtGui, QtCore
 import sys
+import mss
 
 # Subclass QComboBox to make its popup widen to fit contents
 class WideComboBox(QtWidgets.QComboBox):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # popup width is measured once and reused until items or font change
+        self._cached_popup_width = -1
+
+    def _invalidate_popup_width(self):
+        self._cached_popup_width = -1
+
+    def addItem(self, *args, **kwargs):
+        super().addItem(*args, **kwargs)
+        self._invalidate_popup_width()
+
+    def addItems(self, texts):
+        super().addItems(texts)
+        self._invalidate_popup_width()
+
+    def insertItem(self, *args, **kwargs):
+        super().insertItem(*args, **kwargs)
+        self._invalidate_popup_width()
+
+    def removeItem(self, index):
+        super().removeItem(index)
+        self._invalidate_popup_width()
+
+    def clear(self):
+        super().clear()
+        self._invalidate_popup_width()
+
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.FontChange:
+            self._invalidate_popup_width()
+        super().changeEvent(event)
+
     def showPopup(self):
-        fm = self.view().fontMetrics()
-        max_width = max(fm.horizontalAdvance(self.itemText(i)) for i in range(self.count())) + 20
-        popup_width = max(max_width, self.width())
+        if self._cached_popup_width < 0:
+            fm = self.view().fontMetrics()
+            texts = [self.itemText(i) for i in range(self.count())]
+            # one multi-line measurement in C++ gives the width of the widest line
+            self._cached_popup_width = fm.size(0, "\n".join(texts)).width() + 20
+        popup_width = max(self._cached_popup_width, self.width())
         self.view().setMinimumWidth(popup_width)
         super().showPopup()
 
 class ScreenshotOverlay(QtWidgets.QWidget):
-    screenshot_taken = QtCore.Signal(QtGui.QPixmap)
+    # captured pixels as a QImage, usable off the GUI thread for display scaling and OCR
+    screenshot_taken = QtCore.Signal(QtGui.QImage)
 
     def __init__(self):
-        super().__init__(None, QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.FramelessWindowHint)
-        self.setWindowState(self.windowState() | QtCore.Qt.WindowFullScreen)
+        super().__init__(None, QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.FramelessWindowHint | QtCore.Qt.Tool)
+        # cover the whole desktop by geometry instead of a full-screen state transition
+        self.setGeometry(QtGui.QGuiApplication.primaryScreen().virtualGeometry())
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)  # overlay is reused
         self.rubber_band = QtWidgets.QRubberBand(QtWidgets.QRubberBand.Rectangle, self)
         self.origin = QtCore.QPoint()
+        self._capture_rect = QtCore.QRect()
+        self._pending_pos = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_move)
+
+    def showEvent(self, event):
+        # monitors may have been added/removed since the last capture
+        self.setGeometry(QtGui.QGuiApplication.primaryScreen().virtualGeometry())
+        super().showEvent(event)
 
     def mousePressEvent(self, event):
         self.origin = event.pos()
@@ -26,17 +78,147 @@ class ScreenshotOverlay(QtWidgets.QWidget):
         self.rubber_band.show()
 
     def mouseMoveEvent(self, event):
-        self.rubber_band.setGeometry(QtCore.QRect(self.origin, event.pos()).normalized())
+        # only remember the position; the rubber band follows at most once per frame
+        self._pending_pos = event.pos()
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _apply_pending_move(self):
+        if self._pending_pos is not None:
+            self.rubber_band.setGeometry(QtCore.QRect(self.origin, self._pending_pos).normalized())
+            self._pending_pos = None
 
     def mouseReleaseEvent(self, event):
+        self._move_timer.stop()
+        self._pending_pos = None
         self.rubber_band.hide()
         rect = QtCore.QRect(self.origin, event.pos()).normalized()
+        self._capture_rect = QtCore.QRect(self.mapToGlobal(rect.topLeft()), rect.size())
         self.hide()  # önce overlay’i gizle ki ekran alındığında kendisi gözükmesin
-        QtWidgets.QApplication.processEvents()
-        screen = QtGui.QGuiApplication.primaryScreen()
-        pixmap = screen.grabWindow(0, rect.x(), rect.y(), rect.width(), rect.height())
-        self.screenshot_taken.emit(pixmap)
-        self.close()
+        # give the compositor one frame to actually drop the overlay before grabbing
+        QtCore.QTimer.singleShot(16, self._do_capture)
+
+    def _do_capture(self):
+        # only read the selected bytes: clip to every monitor the rect touches, never grab the whole desktop
+        rect = self._capture_rect
+        parts = []
+        for screen in QtGui.QGuiApplication.screens():
+            part = rect.intersected(screen.geometry())
+            if not part.isEmpty():
+                parts.append((part.translated(-rect.topLeft()), *self._screen_region(screen, part)))
+        # the pixel copy runs on the thread pool; QScreen lookups above must stay on the GUI thread
+        task = GrabTask(rect.size(), parts)
+        task.signals.finished.connect(self._on_grabbed, QtCore.Qt.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_grabbed(self, image):
+        if image.isNull():
+            # mss could not read the screen; grab through Qt here on the GUI thread, as QScreen requires
+            rect = self._capture_rect
+            screen = QtGui.QGuiApplication.primaryScreen()
+            image = screen.grabWindow(0, rect.x(), rect.y(), rect.width(), rect.height()).toImage()
+            if image.isNull():
+                return
+        # only the image is handed on: the receiver decides what to upload as a pixmap, and at what size
+        self.screenshot_taken.emit(image)
+
+    @staticmethod
+    def _screen_region(screen, part):
+        # mss works in physical pixels; Qt keeps each screen's origin native and scales only the size
+        dpr = screen.devicePixelRatio()
+        origin = screen.geometry().topLeft()
+        region = {
+            "top": origin.y() + round((part.y() - origin.y()) * dpr),
+            "left": origin.x() + round((part.x() - origin.x()) * dpr),
+            "width": max(1, round(part.width() * dpr)),
+            "height": max(1, round(part.height() * dpr)),
+        }
+        return region, dpr
+
+class _GrabSignals(QtCore.QObject):
+    finished = QtCore.Signal(QtGui.QImage)
+
+class GrabTask(QtCore.QRunnable):
+    # parts: (target rect inside the selection, mss region, device pixel ratio) per monitor
+    def __init__(self, size, parts):
+        super().__init__()
+        self.size = size
+        self.parts = parts
+        self.signals = _GrabSignals()
+
+    def run(self):
+        images = []
+        # pool threads keep no Python thread state between runs, so the handle lives for this grab only
+        # and is closed here; mss has no finalizer that would release it otherwise
+        try:
+            with mss.mss() as sct:
+                for target, region, dpr in self.parts:
+                    raw = sct.grab(region)
+                    # BGRA from mss is already RGB32 on little-endian, so Qt wraps it without conversion;
+                    # copy() detaches from the mss buffer, which does not outlive this call
+                    img = QtGui.QImage(raw.raw, raw.width, raw.height, raw.width * 4, QtGui.QImage.Format_RGB32).copy()
+                    img.setDevicePixelRatio(dpr)
+                    images.append((target, img))
+        except mss.ScreenShotError as e:
+            # e.g. Wayland or no X access: a null image tells the overlay to fall back to Qt's own grab
+            print(f"mss capture failed, falling back to grabWindow: {e}")
+            self.signals.finished.emit(QtGui.QImage())
+            return
+
+        if len(images) == 1:
+            result = images[0][1]
+        else:
+            # selection spans several monitors: stitch the pieces together
+            dpr = max((img.devicePixelRatio() for _, img in images), default=1.0)
+            result = QtGui.QImage(self.size * dpr, QtGui.QImage.Format_RGB32)
+            result.setDevicePixelRatio(dpr)
+            result.fill(QtCore.Qt.black)
+            painter = QtGui.QPainter(result)
+            for target, img in images:
+                painter.drawImage(target, img)
+            painter.end()
+        self.signals.finished.emit(result)
+
+# toolbar metrics, built once
+ICON_SIZE = QtCore.QSize(24, 24)
+NEW_BTN_SIZE = QtCore.QSize(75, 30)
+PLAIN_BTN_SIZE = QtCore.QSize(60, 30)
+DOTS_BTN_SIZE = QtCore.QSize(30, 30)
+
+# toolbar buttons: key -> (text, object name used by TOOLBAR_STYLE, size)
+BUTTON_SPECS = {
+    "new": ("+ Yeni", "newBtn", NEW_BTN_SIZE),
+    "text": ("Yazı", "plainBtn", PLAIN_BTN_SIZE),
+    "image": ("Resim", "plainBtn", PLAIN_BTN_SIZE),
+    "dots": ("...", "dotsBtn", DOTS_BTN_SIZE),
+}
+
+# one stylesheet for the whole toolbar, buttons are picked by object name
+TOOLBAR_STYLE = (
+    "QToolButton#newBtn { background-color: #2E8B57; color: white; border-radius: 4px; }"
+    "QToolButton#newBtn:hover { background-color: #3CB371; }"
+    "QToolButton#plainBtn { background-color: #f0f0f0; color: #333; border: 1px solid #ccc; border-radius: 4px; }"
+    "QToolButton#plainBtn:hover { background-color: #e0e0e0; }"
+)
+
+# above this many pixels a fast preview is shown while the smooth scale runs in the background
+FAST_PREVIEW_PIXELS = 2_000_000
+
+class _ScaleSignals(QtCore.QObject):
+    finished = QtCore.Signal(QtGui.QImage, int)
+
+class ScaleTask(QtCore.QRunnable):
+    # QImage is safe to use off the GUI thread, QPixmap is not
+    def __init__(self, image, size, token):
+        super().__init__()
+        self.image = image
+        self.size = size
+        self.token = token
+        self.signals = _ScaleSignals()
+
+    def run(self):
+        scaled = self.image.scaled(self.size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.signals.finished.emit(scaled, self.token)
 
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
@@ -46,24 +228,26 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Create a toolbar
         self.toolbar = QtWidgets.QToolBar("Main Toolbar")
-        self.toolbar.setIconSize(QtCore.QSize(24, 24))
+        self.toolbar.setIconSize(ICON_SIZE)
         self.addToolBar(QtCore.Qt.TopToolBarArea, self.toolbar)
+        # suppress relayout/repaint while the toolbar is populated
+        self.toolbar.setUpdatesEnabled(False)
+        self.toolbar.setStyleSheet(TOOLBAR_STYLE)
 
         # Connect orientation change to centering logic
+        self._orientation_alignment = {
+            QtCore.Qt.Vertical: QtCore.Qt.AlignHCenter,
+            QtCore.Qt.Horizontal: QtCore.Qt.AlignLeft,
+        }
+        self._last_orientation = None
         self.toolbar.orientationChanged.connect(self.on_toolbar_orientation_changed)
         # Apply initial alignment
         self.on_toolbar_orientation_changed(self.toolbar.orientation())
 
+        buttons = {key: self._make_toolbutton(*spec) for key, spec in BUTTON_SPECS.items()}
+
         # + Yeni button (distinct style)
-        new_btn = QtWidgets.QToolButton()
-        new_btn.setText("+ Yeni")
-        new_btn.setToolButtonStyle(QtCore.Qt.ToolButtonTextOnly)
-        new_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        new_btn.setStyleSheet(
-            "QToolButton { background-color: #2E8B57; color: white; border-radius: 4px; }"
-            "QToolButton:hover { background-color: #3CB371; }"
-        )
-        new_btn.setFixedSize(75, 30)
+        new_btn = buttons["new"]
         self.toolbar.addWidget(new_btn)
         self.toolbar.addSeparator()
 
@@ -84,21 +268,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.delay_combo = WideComboBox()
         self.delay_combo.addItems(["0", "3", "5", "10"])
         self.delay_combo.setFixedSize(45, 30)
+        self._delay_ms = 0
+        self.delay_combo.currentTextChanged.connect(self.on_delay_changed)
         self.toolbar.addWidget(self.delay_combo)
         self.toolbar.addSeparator()
 
         # Yazı and Resim buttons (same design)
-        for text in ["Yazı", "Resim"]:
-            btn = QtWidgets.QToolButton()
-            btn.setText(text)
-            btn.setToolButtonStyle(QtCore.Qt.ToolButtonTextOnly)
-            btn.setCursor(QtCore.Qt.PointingHandCursor)
-            btn.setStyleSheet(
-                "QToolButton { background-color: #f0f0f0; color: #333; border: 1px solid #ccc; border-radius: 4px; }"
-                "QToolButton:hover { background-color: #e0e0e0; }"
-            )
-            btn.setFixedSize(60, 30)
-            self.toolbar.addWidget(btn)
+        for key in ("text", "image"):
+            self.toolbar.addWidget(buttons[key])
             self.toolbar.addSeparator()
 
         # Right alignment spacer
@@ -107,53 +284,94 @@ class MainWindow(QtWidgets.QMainWindow):
         self.toolbar.addWidget(spacer)
 
         # "..." menu button without arrow
-        menu_btn = QtWidgets.QToolButton()
-        menu_btn.setText("...")
-        menu_btn.setCursor(QtCore.Qt.PointingHandCursor)
-        menu_btn.setToolButtonStyle(QtCore.Qt.ToolButtonTextOnly)
-        menu_btn.setFixedSize(30, 30)
-        menu = QtWidgets.QMenu(menu_btn)
-        menu.addAction("Ayarlar")
-        menu.addSeparator()
-        menu.addAction("Info")
-        menu_btn.clicked.connect(lambda: menu.exec(menu_btn.mapToGlobal(QtCore.QPoint(0, menu_btn.height()))))
+        menu_btn = buttons["dots"]
+        # the menu itself is only built the first time it is opened
+        self.menu_btn = menu_btn
+        self._dots_menu = None
+        menu_btn.clicked.connect(self._show_dots_menu)
         self.toolbar.addWidget(menu_btn)
+        self.toolbar.setUpdatesEnabled(True)
 
         # Central image display label
         self.image_label = QtWidgets.QLabel("Ana içerik burada.")
         self.image_label.setAlignment(QtCore.Qt.AlignCenter)
         self.setCentralWidget(self.image_label)
 
+        self._scale_token = 0
+        self.captured_image = None
+
+        # overlay is built once and only shown/hidden per capture
+        self.overlay = ScreenshotOverlay()
+        self.overlay.screenshot_taken.connect(self.on_screenshot)
+
         # connect screenshot
         new_btn.clicked.connect(self.start_screenshot)
 
+    @staticmethod
+    def _make_toolbutton(text, object_name, size):
+        btn = QtWidgets.QToolButton()
+        btn.setText(text)
+        btn.setToolButtonStyle(QtCore.Qt.ToolButtonTextOnly)
+        btn.setCursor(QtCore.Qt.PointingHandCursor)
+        btn.setObjectName(object_name)
+        btn.setFixedSize(size)
+        return btn
+
     def on_toolbar_orientation_changed(self, orientation):
         # When vertical, center items horizontally; otherwise left-align
-        if orientation == QtCore.Qt.Vertical:
-            self.toolbar.layout().setAlignment(QtCore.Qt.AlignHCenter)
-        else:
-            self.toolbar.layout().setAlignment(QtCore.Qt.AlignLeft)
+        if orientation == self._last_orientation:
+            return  # spurious signal, skip the layout invalidation
+        self._last_orientation = orientation
+        self.toolbar.layout().setAlignment(self._orientation_alignment[orientation])
+
+    def _build_dots_menu(self):
+        menu = QtWidgets.QMenu(self.menu_btn)
+        menu.addAction("Ayarlar")
+        menu.addSeparator()
+        menu.addAction("Info")
+        return menu
+
+    @QtCore.Slot()
+    def _show_dots_menu(self):
+        if self._dots_menu is None:
+            self._dots_menu = self._build_dots_menu()
+        self._dots_menu.exec(self.menu_btn.mapToGlobal(QtCore.QPoint(0, self.menu_btn.height())))
+
+    def on_delay_changed(self, text):
+        # parsed once per selection instead of on every capture
+        self._delay_ms = int(text) * 1000
 
     def start_screenshot(self):
         # optional delay
-        delay = int(self.delay_combo.currentText())
-        if delay > 0:
-            QtCore.QTimer.singleShot(delay*1000, self._show_overlay)
+        if self._delay_ms > 0:
+            QtCore.QTimer.singleShot(self._delay_ms, self._show_overlay)
         else:
             self._show_overlay()
 
     def _show_overlay(self):
-        self.overlay = ScreenshotOverlay()
-        self.overlay.screenshot_taken.connect(self.on_screenshot)
+        self.overlay.rubber_band.hide()
         self.overlay.show()
+        # bring it up explicitly so the window manager does not delay focus
+        self.overlay.raise_()
+        self.overlay.activateWindow()
+
+    def on_screenshot(self, image: QtGui.QImage):
+        # display in central label; smooth scaling happens on the thread pool
+        self.captured_image = image
+        target = self.image_label.size()
+        self._scale_token += 1
+        if image.width() * image.height() > FAST_PREVIEW_PIXELS:
+            self.image_label.setPixmap(QtGui.QPixmap.fromImage(
+                image.scaled(target, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
+            ))
+        task = ScaleTask(image, target, self._scale_token)
+        task.signals.finished.connect(self._on_scaled)
+        QtCore.QThreadPool.globalInstance().start(task)
 
-    def on_screenshot(self, pixmap: QtGui.QPixmap):
-        # display in central label
-        self.image_label.setPixmap(pixmap.scaled(
-            self.image_label.size(),
-            QtCore.Qt.KeepAspectRatio,
-            QtCore.Qt.SmoothTransformation
-        ))
+    def _on_scaled(self, image: QtGui.QImage, token: int):
+        # drop results of captures that were superseded while scaling
+        if token == self._scale_token:
+            self.image_label.setPixmap(QtGui.QPixmap.fromImage(image))
 
 if __name__ == '__main__':
     app = QtWidgets.QApplication(sys.argv)
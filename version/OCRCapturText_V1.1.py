@@ -1,17 +1,41 @@
 import os
+import asyncio
+import atexit
 import json
+import queue
+import struct
+import subprocess
 import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import functools # Added for functools.wraps
+import threading
+from collections import OrderedDict
 
 import ctypes
+import cv2
+import mss
+import numpy as np
 import pyautogui
 import pyperclip
+# Tesseract's OpenMP threads only contend with each other on screenshot-sized images. OpenMP reads
+# this when the library loads, so it must be set before pytesseract/tesserocr are imported (setting it
+# later in __main__ would be too late for tesserocr). To OCR many images at once, run several
+# single-threaded recognitions side by side (see OCRProcessor.extract_texts, or separate processes)
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
 import pytesseract
 from PIL import Image, ImageTk, ImageOps
+
+try:
+    from tesserocr import PyTessBaseAPI
+except ImportError: # tesserocr is optional; fall back to the tesseract executable via pytesseract
+    PyTessBaseAPI = None
 from concurrent.futures import ThreadPoolExecutor
 
+if os.name == 'nt':
+    import win32clipboard # Provided by pywin32, which is only installed on Windows
+
+@functools.lru_cache(maxsize=None) # Awareness can only be set once per process, later calls are no-ops
 def make_dpi_aware():
     """Makes the application DPI aware to ensure proper display scaling on Windows systems."""
     if os.name == 'nt':
@@ -20,38 +44,117 @@ def make_dpi_aware():
         except Exception:
             pass
 
+def bgra_to_gray(buffer, width, height):
+    """
+    Converts a raw BGRA pixel buffer (as returned by mss) to grayscale in a single pass.
+    
+    Returns:
+        2D uint8 numpy array of shape (height, width)
+    """
+    bgra = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4) # View, no copy
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY)
+
+def image_to_dib(image):
+    """
+    Packs a PIL image as a device-independent bitmap without running the BMP encoder.
+
+    Args:
+        image: PIL Image object; alpha is dropped since clipboard consumers handle it poorly
+
+    Returns:
+        Tuple of (BITMAPINFOHEADER bytes, pixel bytes) for a 32-bit bottom-up DIB
+    """
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    # A negative row step makes the packer emit rows bottom-up in the same pass, which every
+    # clipboard consumer understands (top-down DIBs are not universally supported). 32-bit rows
+    # are always 4-byte aligned, so no row padding is needed
+    width, height = image.size
+    pixels = image.tobytes('raw', ('BGRX', 0, -1))
+    header = struct.pack('<LllHHLLllLL', 40, width, height, 1, 32, 0, len(pixels), 0, 0, 0, 0)
+    return header, pixels
+
+def image_to_ppm(image):
+    """Packs a PIL image as binary PPM (P6) data, which Tk decodes into a PhotoImage row by row."""
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    width, height = image.size
+    return b'P6 %d %d 255\n' % (width, height) + image.tobytes()
+
+def global_alloc_from_chunks(*chunks):
+    """
+    Copies the given byte chunks back to back into a new movable HGLOBAL (Windows only).
+    The clipboard takes ownership of the handle once SetClipboardData succeeds.
+    """
+    GMEM_MOVEABLE = 0x0002
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GlobalAlloc.argtypes = [ctypes.c_uint, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = ctypes.c_void_p
+    kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+    kernel32.GlobalFree.argtypes = [ctypes.c_void_p]
+
+    handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, sum(len(chunk) for chunk in chunks))
+    if not handle:
+        raise ctypes.WinError()
+    pointer = kernel32.GlobalLock(handle)
+    if not pointer:
+        kernel32.GlobalFree(handle)
+        raise ctypes.WinError()
+    try:
+        offset = 0
+        for chunk in chunks:
+            ctypes.memmove(pointer + offset, chunk, len(chunk))
+            offset += len(chunk)
+    finally:
+        kernel32.GlobalUnlock(handle)
+    return handle
+
 class ConfigurationManager:
     """Manages application configuration settings through loading and saving to a JSON file."""
     DEFAULT_CONFIG = {
         'tesseract_path': r'C:\Program Files\Tesseract-OCR\tesseract.exe' if os.name == 'nt' else '',
-        'interface_language': 'tur'
+        'interface_language': 'tur',
+        'ocr_language': 'tur',
+        'preprocess_ocr': True, # Binarize and rescale captures before OCR instead of leaving it to Tesseract
+        'ocr_psm': 6, # Tesseract page segmentation mode, e.g. 7 for captures of a single line
+        'ocr_oem': 1 # Tesseract engine mode, 1 = LSTM only
     }
     CONFIG_FILE = os.path.join(os.path.expanduser('~'), '.screen_capture_config.json')
     
+    _loaded_config = None # Memoized result of the first load, kept in sync by save_config
+
     @classmethod
     def load_config(cls):
         """Loads configuration from file or returns default configuration if file not found or invalid."""
+        if cls._loaded_config is not None:
+            return cls._loaded_config.copy()
+
+        config = cls.DEFAULT_CONFIG.copy()
         try:
-            if os.path.exists(cls.CONFIG_FILE):
-                with open(cls.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                # Ensure all default keys exist in loaded config
-                for key, value in cls.DEFAULT_CONFIG.items():
-                    if key not in config:
-                        config[key] = value
-                return config
+            with open(cls.CONFIG_FILE, 'rb') as f: # One open instead of an exists check first
+                # Saved values override the defaults, missing keys keep their default value
+                config = {**cls.DEFAULT_CONFIG, **json.loads(f.read())}
+        except FileNotFoundError: # First run, nothing saved yet
+            pass
         except Exception as e:
             print(f"Error loading configuration: {e}")
         
-        return cls.DEFAULT_CONFIG.copy()
+        cls._loaded_config = config
+        return config.copy()
     
     @classmethod
     def save_config(cls, config):
         """Saves configuration to file and returns success status."""
         try:
-            with open(cls.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4)
+            data = json.dumps(config, indent=4) # Serialize in one go and write once, not token by token
+            # Write a temporary file and swap it in, so a crash mid-write cannot leave a truncated config
+            temp_file = cls.CONFIG_FILE + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(temp_file, cls.CONFIG_FILE)
+            cls._loaded_config = config.copy()
             return True
         except Exception as e:
             print(f"Error saving configuration: {e}")
@@ -60,11 +163,16 @@ class ConfigurationManager:
 class ConfigurationDialog:
     """Dialog window for configuring application settings with validation capabilities."""
     
-    def __init__(self, parent, config, ui_texts):
+    _version_cache = {} # (tesseract path, file mtime) -> version string of a successful validation
+
+    def __init__(self, parent, config, ui_texts, executor=None):
         self.parent = parent
         self.config = config.copy()  # Work with a copy
         self.ui_texts = ui_texts
+        self.executor = executor # Runs the tesseract probe off the Tk thread when provided
         self.result = None
+        self._probe_token = 0 # Bumped per probe so only the latest probe's result is shown
+        self.after_id = None # Scheduled validation, if any
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(self.ui_texts['config_title'])
@@ -134,7 +242,15 @@ class ConfigurationDialog:
         save_button.pack(side='right', padx=5)
         
         self.after_id = self.dialog.after(100, self.validate_tesseract_path)
+        # Typing a path revalidates it, but only once the user pauses rather than on every keystroke
+        self.tesseract_path_var.trace_add('write', self._on_path_changed)
         
+    def _on_path_changed(self, *args):
+        """Schedules validation of the edited path, replacing any validation still pending."""
+        if self.after_id:
+            self.dialog.after_cancel(self.after_id)
+        self.after_id = self.dialog.after(300, self.validate_tesseract_path)
+
     def browse_tesseract_path(self):
         """Opens a file dialog to browse and select the Tesseract executable path."""
         file_types = [("Executable files", "*.exe")] if os.name == 'nt' else [("All files", "*")]
@@ -151,36 +267,113 @@ class ConfigurationDialog:
             self.tesseract_path_var.set(path)
             self.validate_tesseract_path()
             
-    def validate_tesseract_path(self):
-        """Validates if the selected Tesseract path is correct and functional."""
+    @staticmethod
+    def _probe_tesseract_version(path):
+        """
+        Runs the given tesseract executable with --version and returns the reported version.
+        The executable is called directly instead of through pytesseract, whose get_tesseract_version
+        is cached after the first call and reads the process-wide tesseract_cmd.
+        """
+        creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0 # No console flash on Windows
+        result = subprocess.run(
+            [path, '--version'], capture_output=True, text=True, timeout=10, creationflags=creationflags
+        )
+        output = (result.stdout or result.stderr).strip()
+        if result.returncode != 0 or not output.lower().startswith('tesseract'):
+            raise RuntimeError(output or f"exit code {result.returncode}")
+        return output.split()[1] # First line reads "tesseract <version>"
+
+    def validate_tesseract_path(self, on_done=None):
+        """
+        Validates if the selected Tesseract path is correct and functional.
+        The executable is probed on the executor when one is available, so on_done (if given)
+        receives the outcome and the validated path instead of the return value, which is None
+        while the probe runs.
+        """
+        self._cancel_scheduled_validation() # Validating now supersedes a scheduled run
         path = self.tesseract_path_var.get()
         
         if not path:
             self._update_validation_label('config_no_path', "red")
-            return False
+            return self._report_validation(on_done, False, path)
             
         if not os.path.exists(path):
             self._update_validation_label('config_invalid_path', "red")
-            return False
+            return self._report_validation(on_done, False, path)
             
-        original_path = pytesseract.pytesseract.tesseract_cmd
+        # Skip spawning tesseract again for an executable that was already validated and is unchanged
+        cache_key = (path, os.path.getmtime(path))
+        cached_version = self._version_cache.get(cache_key)
+        if cached_version is not None:
+            self._update_validation_label('config_validation_success', "green", cached_version)
+            return self._report_validation(on_done, True, path)
+
+        self._probe_token += 1
+        token = self._probe_token
+        if self.executor is None:
+            try:
+                result = self._probe_tesseract_version(path)
+            except Exception as e:
+                result = e
+            return self._apply_probe_result(token, cache_key, result, on_done)
+
+        self._update_validation_label('config_validating', "gray")
+        future = self.executor.submit(self._probe_tesseract_version, path)
+        future.add_done_callback(
+            lambda f: self._post_probe_result(token, cache_key, f.exception() or f.result(), on_done)
+        )
+        return None
+
+    def _post_probe_result(self, token, cache_key, result, on_done):
+        """Hands a finished probe back to the Tk thread, unless the dialog was closed meanwhile."""
         try:
-            pytesseract.pytesseract.tesseract_cmd = path
-            version = pytesseract.get_tesseract_version()
-            self._update_validation_label('config_validation_success', "green", version)
-            return True
-        except Exception as e:
-            self._update_validation_label('config_validation_error', "red", str(e))
-            return False
-        finally:
-            pytesseract.pytesseract.tesseract_cmd = original_path # Ensure restoration
+            self.dialog.after(0, self._apply_probe_result, token, cache_key, result, on_done)
+        except (tk.TclError, RuntimeError): # Dialog already destroyed
+            pass
+
+    def _apply_probe_result(self, token, cache_key, result, on_done):
+        """Shows the outcome of a tesseract probe and caches successful versions."""
+        if token != self._probe_token: # Another validation started, or the dialog closed, while this probe ran
+            return None
+        path = cache_key[0]
+        if isinstance(result, Exception):
+            self._update_validation_label('config_validation_error', "red", str(result))
+            return self._report_validation(on_done, False, path)
+        self._version_cache[cache_key] = result
+        self._update_validation_label('config_validation_success', "green", result)
+        return self._report_validation(on_done, True, path)
+
+    @staticmethod
+    def _report_validation(on_done, is_valid, path):
+        """Passes the validation outcome and the path it applies to to the optional callback, and returns the outcome."""
+        if on_done:
+            on_done(is_valid, path)
+        return is_valid
+
+    def _cancel_scheduled_validation(self):
+        """Cancels a validation still waiting for the user to stop typing."""
+        if self.after_id:
+            self.dialog.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _close(self):
+        """Destroys the dialog after cancelling scheduled validations and discarding running probes."""
+        self._cancel_scheduled_validation()
+        self._probe_token += 1 # A probe that finishes later must not touch the destroyed widgets
+        self.dialog.destroy()
             
     def on_save(self):
         """Handles the save button click by validating and storing configuration changes."""
-        if self.validate_tesseract_path():
-            self.config['tesseract_path'] = self.tesseract_path_var.get()
+        self.validate_tesseract_path(on_done=self._finish_save)
+
+    def _finish_save(self, is_valid, path):
+        """Stores the configuration and closes the dialog once the path has been validated."""
+        if path != self.tesseract_path_var.get(): # Edited while the probe ran: validate what is there now
+            self.validate_tesseract_path(on_done=self._finish_save)
+        elif is_valid:
+            self.config['tesseract_path'] = path
             self.result = self.config
-            self.dialog.destroy()
+            self._close()
         else:
             self._show_message_from_ui_texts(
                 messagebox.showwarning,
@@ -190,10 +383,7 @@ class ConfigurationDialog:
             
     def on_cancel(self, event=None):
         """Handles dialog cancellation by closing without saving changes."""
-        if hasattr(self, 'after_id') and self.after_id: # Check if after_id exists
-            self.dialog.after_cancel(self.after_id)
-            self.after_id = None # Clear it
-        self.dialog.destroy()
+        self._close()
         
     def show(self):
         """Shows the dialog modally and returns the result after it's closed."""
@@ -208,8 +398,15 @@ class ScreenCapturer:
         self.canvas = None
         self.start_x = None
         self.start_y = None
+        self._origin_x = None
+        self._origin_y = None
         self.rect = None
         self.captured_image = None
+        self.captured_gray = None # Grayscale pixels for OCR, taken from the same grab when available
+        # Opened on the first grab and then kept, so the capture handles are reused between captures and
+        # a display mss cannot open is handled by grab's pyautogui fallback instead of failing at startup
+        self._sct = None
+        self._screen_bounds = None # (left, top, right, bottom) of the virtual screen, re-read when a region leaves it
 
     def capture_screen(self, root, callback):
         """Creates a fullscreen overlay for selecting a screen area to capture."""
@@ -235,20 +432,16 @@ class ScreenCapturer:
         """Handles mouse button press to start area selection."""
         self.start_x = event.x_root
         self.start_y = event.y_root
+        # The overlay does not move during a drag, so its origin is looked up once here
+        self._origin_x = self.start_x - self.selection_window.winfo_rootx()
+        self._origin_y = self.start_y - self.selection_window.winfo_rooty()
         self.rect = self.canvas.create_rectangle(
             event.x, event.y, event.x, event.y, outline='red', width=2
         )
 
     def on_mouse_drag(self, event):
         """Updates selection rectangle as mouse is dragged."""
-        current_x, current_y = event.x, event.y
-        self.canvas.coords(
-            self.rect,
-            self.start_x - self.selection_window.winfo_rootx(),
-            self.start_y - self.selection_window.winfo_rooty(),
-            current_x,
-            current_y,
-        )
+        self.canvas.coords(self.rect, self._origin_x, self._origin_y, event.x, event.y)
 
     def on_button_release(self, event, callback):
         """Captures the selected screen area when mouse button is released."""
@@ -261,13 +454,14 @@ class ScreenCapturer:
         y2 = max(self.start_y, end_y)
 
         self.selection_window.withdraw()
+        self.captured_gray = None
 
         try:
             # Ensure coordinates are valid
             width = x2 - x1
             height = y2 - y1
             if width > 0 and height > 0:
-                self.captured_image = pyautogui.screenshot(region=(x1, y1, width, height))
+                self.captured_image = self.grab(x1, y1, width, height)
             else:
                 self.captured_image = None # No valid region selected
         except Exception as e:
@@ -278,7 +472,57 @@ class ScreenCapturer:
             self.selection_window = None # Clear reference
 
         # Call the callback function
-        callback(self.captured_image)
+        callback(self.captured_image, self.captured_gray)
+
+    def _get_sct(self):
+        """Returns the mss instance, opening it on first use."""
+        if self._sct is None:
+            self._sct = mss.mss()
+        return self._sct
+
+    def _refresh_screen_bounds(self):
+        """Reads the virtual screen bounds, reopening mss first since it keeps its monitor list for good."""
+        if self._screen_bounds is not None: # Bounds were read before, so the monitor layout may have changed
+            self.close()
+        monitor = self._get_sct().monitors[0] # Bounding box of all monitors
+        self._screen_bounds = (
+            monitor['left'], monitor['top'],
+            monitor['left'] + monitor['width'], monitor['top'] + monitor['height']
+        )
+
+    def _clamp_to_screen(self, x, y, width, height):
+        """
+        Clips a region to the virtual screen. The bounds are cached, and only looked up again when a
+        region reaches past them, so a monitor attached or moved since the last capture is picked up.
+        """
+        if self._screen_bounds is None:
+            self._refresh_screen_bounds()
+        left, top, right, bottom = self._screen_bounds
+        if x < left or y < top or x + width > right or y + height > bottom:
+            self._refresh_screen_bounds()
+            left, top, right, bottom = self._screen_bounds
+        x1, y1 = max(x, left), max(y, top)
+        x2, y2 = min(x + width, right), min(y + height, bottom)
+        if x2 <= x1 or y2 <= y1:
+            self._screen_bounds = None # Look the layout up again on the next capture as well
+            raise ValueError(f"Region {(x, y, width, height)} lies outside the screen")
+        return x1, y1, x2 - x1, y2 - y1
+
+    def grab(self, x, y, width, height):
+        """Grabs only the given screen region, falling back to pyautogui if mss fails."""
+        try:
+            x, y, width, height = self._clamp_to_screen(x, y, width, height)
+            raw = self._get_sct().grab({'left': x, 'top': y, 'width': width, 'height': height})
+        except mss.ScreenShotError as e:
+            print(f"mss capture failed, using pyautogui: {e}")
+            # A monitor may have been added or removed: reopen mss and re-read the layout next time
+            self.close()
+            self._screen_bounds = None
+            return pyautogui.screenshot(region=(x, y, width, height))
+        # Grayscale for OCR is collapsed from the BGRA buffer while it is still at hand,
+        # the display image is decoded from the same buffer straight into RGB
+        self.captured_gray = bgra_to_gray(raw.raw, raw.width, raw.height)
+        return Image.frombytes('RGB', raw.size, raw.raw, 'raw', 'BGRX')
 
     def cancel_capture(self, event=None):
         """Cancels the screen capture process when Escape is pressed."""
@@ -286,28 +530,221 @@ class ScreenCapturer:
             self.selection_window.destroy()
             self.selection_window = None
 
+    def close(self):
+        """Releases the screen capture handles held open between captures."""
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
 class OCRProcessor:
     """Handles text extraction from images using optical character recognition."""
 
-    def __init__(self, language='tur', tesseract_path=None):
+    # Small captures are upscaled so the shorter side reaches UPSCALE_MIN_SIDE, without the longer
+    # side exceeding UPSCALE_MAX_SIDE or the image growing more than UPSCALE_MAX_FACTOR times
+    UPSCALE_MIN_SIDE = 1024
+    UPSCALE_MAX_SIDE = 2048
+    UPSCALE_MAX_FACTOR = 4
+
+    # Captures with a longer side above DOWNSCALE_MAX_SIDE (e.g. full 4K screens) are halved before OCR,
+    # unless that would take the shorter side below UPSCALE_MIN_SIDE and only be enlarged again
+    DOWNSCALE_MAX_SIDE = 2000
+
+    # Adaptive threshold neighbourhood (odd, in pixels) and offset subtracted from the local mean
+    THRESHOLD_BLOCK_SIZE = 31
+    THRESHOLD_OFFSET = 10
+
+    # Screen captures are ~96 DPI; telling Tesseract skips its resolution guess
+    SOURCE_DPI = 96
+    # Tesseract treats anything below 70 DPI as invalid and falls back to guessing
+    MIN_DPI = 70
+
+    def __init__(self, language='tur', tesseract_path=None, binarize=True, psm=6, oem=1):
         self.language = language
+        self.tesseract_path = tesseract_path
+        self.binarize = binarize # False hands Tesseract the plain grayscale and leaves thresholding to it
+        # Page segmentation 6 treats the capture as one block of text and skips layout analysis;
+        # engine mode 1 loads and runs only the LSTM recognizer
+        self.psm = psm
+        self.oem = oem
+        self.tessdata_path = None
         if tesseract_path: # This sets it globally for pytesseract if path is provided
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
+            tessdata_path = os.path.join(os.path.dirname(tesseract_path), 'tessdata')
+            if os.path.isdir(tessdata_path):
+                self.tessdata_path = tessdata_path
+
+        self._lock = threading.Lock()
+        self._batch_lock = threading.Lock()
+        self._batch_processors = [] # Extra engines for extract_texts, built on demand and kept until close
+        if PyTessBaseAPI is not None:
+            self.api = self._create_api()
+            self._recognize = self._recognize_tesserocr
+        else:
+            self.api = None
+            self._recognize = self._recognize_pytesseract
+
+    def _create_api(self):
+        """Creates the in-process Tesseract API, which keeps the language data loaded between calls."""
+        kwargs = {'path': self.tessdata_path} if self.tessdata_path else {}
+        api = PyTessBaseAPI(lang=self.language, psm=self.psm, oem=self.oem, **kwargs)
+        if self.binarize:
+            api.SetVariable('tessedit_do_invert', '0') # preprocess already yields dark text on light
+        api.SetVariable('debug_file', os.devnull)
+        return api
+
+    def _recognize_tesserocr(self, pixels, dpi):
+        """Recognizes an 8-bit (binarized or grayscale) image with the in-process Tesseract API."""
+        height, width = pixels.shape
+        with self._lock: # A Tesseract API handle must not be used from two threads at once
+            self.api.SetImageBytes(pixels.tobytes(), width, height, 1, width)
+            self.api.SetSourceResolution(dpi) # Must follow SetImage, which resets it
+            return self.api.GetUTF8Text()
+
+    def _recognize_pytesseract(self, pixels, dpi):
+        """Recognizes an 8-bit (binarized or grayscale) image by running the tesseract executable through pytesseract."""
+        tesseract_config = f'--oem {self.oem} --psm {self.psm} --dpi {dpi}'
+        image = Image.fromarray(pixels)
+        if self.binarize:
+            tesseract_config += ' -c tessedit_do_invert=0'
+            image = image.convert('1')
+        # pytesseract hands images over through a temp file saved in image.format, PNG by default.
+        # An uncompressed BMP skips the deflate pass, and a 1-bit one is an eighth of the 8-bit size
+        image.format = 'BMP'
+        return pytesseract.image_to_string(image, lang=self.language, config=tesseract_config)
+
+    @staticmethod
+    def to_grayscale(image, gray=None):
+        """Returns the grayscale pixels of the image, reusing the capture-time grayscale if given."""
+        if gray is None:
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+        return gray
+
+    def preprocess(self, image, gray=None):
+        """
+        Binarizes the image for OCR: grayscale, dark text on a light background, adaptive threshold,
+        then downscales very large captures or upscales small ones.
+
+        Args:
+            image: PIL Image object containing the captured screen area
+            gray: Optional grayscale version of image (2D uint8 array) produced at capture time
+
+        Returns:
+            2D uint8 numpy array with values 0 and 255
+        """
+        gray = self.to_grayscale(image, gray)
+        if cv2.mean(gray)[0] < 127: # Mostly dark: light text on a dark theme, flip it
+            gray = cv2.bitwise_not(gray) # New array, the capture's own grayscale stays untouched
+
+        height, width = gray.shape
+        # Screen text stays legible at half size
+        if max(height, width) > self.DOWNSCALE_MAX_SIDE and min(height, width) // 2 >= self.UPSCALE_MIN_SIDE:
+            gray = cv2.resize(gray, (width // 2, height // 2), interpolation=cv2.INTER_AREA)
+
+        # Threshold at capture size so only the final mask is enlarged
+        binary = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+            self.THRESHOLD_BLOCK_SIZE, self.THRESHOLD_OFFSET
+        )
+
+        height, width = binary.shape
+        if min(height, width) < self.UPSCALE_MIN_SIDE:
+            scale = min(
+                self.UPSCALE_MIN_SIDE / min(height, width),
+                self.UPSCALE_MAX_SIDE / max(height, width),
+                self.UPSCALE_MAX_FACTOR
+            )
+            if scale > 1: # Nearest neighbour is exact for 0/255 data and far cheaper than cubic
+                binary = cv2.resize(binary, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_NEAREST)
+        return binary
 
-    def extract_text(self, image):
+    def extract_text(self, image, gray=None):
         """
         Extracts text from an image using Tesseract OCR with optimized settings.
         
         Args:
             image: PIL Image object containing the captured screen area
+            gray: Optional grayscale version of image (2D uint8 array) produced at capture time
             
         Returns:
             Extracted text as a string
         """
-        gray = image.convert('L')
-        tesseract_config = '--oem 1 --psm 6'
-        text = pytesseract.image_to_string(gray, lang=self.language, config=tesseract_config)
-        return text
+        if self.binarize:
+            pixels = self.preprocess(image, gray)
+        else:
+            pixels = self.to_grayscale(image, gray)
+        dpi = round(self.SOURCE_DPI * pixels.shape[1] / image.width) # Upscaling raises the effective resolution
+        dpi = max(dpi, self.MIN_DPI) # A halved capture would otherwise report 48 DPI and be ignored
+        return self._recognize(pixels, dpi)
+
+    async def extract_text_async(self, image, gray=None):
+        """Extracts text on a worker thread so a running asyncio event loop is not blocked."""
+        return await asyncio.to_thread(self.extract_text, image, gray)
+
+    async def extract_texts_async(self, images, max_concurrency=None):
+        """Runs extract_texts on a worker thread so a running asyncio event loop is not blocked."""
+        return await asyncio.to_thread(self.extract_texts, images, max_concurrency)
+
+    def extract_texts(self, images, max_concurrency=None):
+        """
+        Extracts text from several images concurrently, e.g. for multi-region captures.
+        
+        Args:
+            images: Iterable of PIL Image objects
+            max_concurrency: Upper bound on simultaneous recognitions (defaults to the CPU count)
+            
+        Returns:
+            List of extracted strings in the same order as the images
+        """
+        images = list(images)
+        concurrency = max(1, min(max_concurrency or os.cpu_count() or 1, len(images)))
+        # One API handle recognizes one image at a time, so tesserocr needs a handle per worker;
+        # with OMP_THREAD_LIMIT=1 each recognition then gets a core to itself
+        if self.api is not None:
+            processors = [self] + self._get_batch_processors(concurrency - 1)
+        else:
+            processors = [self] * concurrency
+
+        # Plain threads rather than asyncio.run, which fails when called from a thread with a running loop
+        # (async callers use extract_texts_async)
+        idle_processors = queue.Queue()
+        for processor in processors:
+            idle_processors.put(processor)
+
+        def run_one(image):
+            processor = idle_processors.get()
+            try:
+                return processor.extract_text(image)
+            finally:
+                idle_processors.put(processor)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(run_one, images))
+
+    def _get_batch_processors(self, count):
+        """
+        Returns count extra processors with this one's settings, building any that are missing.
+        They stay loaded for later batches and are ended by close(), including a partially built set.
+        """
+        with self._batch_lock:
+            while len(self._batch_processors) < count:
+                self._batch_processors.append(OCRProcessor(
+                    language=self.language, tesseract_path=self.tesseract_path,
+                    binarize=self.binarize, psm=self.psm, oem=self.oem
+                ))
+            return self._batch_processors[:count]
+
+    def close(self):
+        """Ends the in-process Tesseract API, if any, and frees its language data."""
+        with self._batch_lock:
+            batch_processors, self._batch_processors = self._batch_processors, []
+        for batch_processor in batch_processors:
+            batch_processor.close()
+        with self._lock:
+            if self.api is not None:
+                self.api.End()
+                self.api = None
 
 # Decorator to ensure a screenshot has been captured
 def require_capture(func):
@@ -330,86 +767,30 @@ def require_capture(func):
 class MainApplication:
     """Main application class that manages the overall UI and workflow."""
 
-    UI_TEXTS_BY_LANGUAGE = {
-        'tur': {
-            'title': 'Ekran Kesme-Kopyalama Aracı',
-            'new_button': '+ Yeni',
-            'language_label': 'OCR dili:',
-            'delay_label': 'Gecikme (sn):',
-            'text_button': 'Yazı',
-            'image_button': 'Resim',
-            'about_title': 'Hakkında',
-            'about_message': 'Ekran Alıntısı Aracı\nSürüm 1.1',
-            'warning_no_screenshot': 'Önce bir ekran görüntüsü alın.',
-            'info_image_copied': 'Resim panoya kopyalandı.',
-            'info_text_copied': 'Metin panoya kopyalandı.',
-            'error_tesseract_not_found': 'Tesseract OCR bulunamadı. Lütfen Tesseract\'ı yükleyin veya yolunu yapılandırın.',
-            'error_ocr': 'OCR işlemi sırasında bir hata oluştu:\n{}',
-            'warning_screenshot_failed': 'Ekran görüntüsü alınamadı.',
-            'menu_languages': 'Diller',
-            'menu_configuration': 'Ayarlar',
-            'menu_about': 'Hakkında',
-            'ocr_languages': ['Türkçe', 'İngilizce'],
-            'language_codes': {'Türkçe': 'tur', 'İngilizce': 'eng'},
-            'config_title': 'Ayarlar',
-            'config_tesseract_path': 'Tesseract OCR Yolu',
-            'config_browse': 'Gözat',
-            'config_validate': 'Doğrula',
-            'config_save': 'Kaydet',
-            'config_cancel': 'İptal',
-            'config_no_path': 'Tesseract yolu belirtilmedi!',
-            'config_invalid_path': 'Geçersiz yol: Dosya bulunamadı!',
-            'config_validation_success': 'Tesseract OCR {} doğrulandı ✓',
-            'config_validation_error': 'Doğrulama hatası:\n{}',
-            'config_invalid_config_title': 'Geçersiz Ayarlar',
-            'config_invalid_config_message': 'Lütfen Tesseract yolunu doğrulayın ve tekrar deneyin.',
-            'config_select_tesseract': 'Tesseract OCR Çalıştırılabilir Dosyasını Seçin',
-            'error_copy_image_failed': 'Resmi panoya kopyalama başarısız:\n{}',
-            'info_copy_not_supported': 'Resim panoya kopyalanamıyor. Bu özellik mevcut platformda desteklenmiyor.',
-            'warning_title': 'Uyarı',
-            'info_title': 'Bilgi',
-            'error_title': 'Hata'
-        },
-        'eng': {
-            'title': 'Screen Cut-Copy Tool',
-            'new_button': '+ New',
-            'language_label': 'OCR lang:',
-            'delay_label': 'Delay (s):',
-            'text_button': 'Text',
-            'image_button': 'Image',
-            'about_title': 'About',
-            'about_message': 'Screen Capture Tool\nVersion 1.1',
-            'warning_no_screenshot': 'Please capture a screenshot first.',
-            'info_image_copied': 'Image copied to clipboard.',
-            'info_text_copied': 'Text copied to clipboard.',
-            'error_tesseract_not_found': 'Tesseract OCR not found. Please install Tesseract or configure its path.',
-            'error_ocr': 'An error occurred during OCR:\n{}',
-            'warning_screenshot_failed': 'Failed to capture the screenshot.',
-            'menu_languages': 'Languages',
-            'menu_configuration': 'Settings',
-            'menu_about': 'About',
-            'ocr_languages': ['Turkish', 'English'],
-            'language_codes': {'Turkish': 'tur', 'English': 'eng'},
-            'config_title': 'Settings',
-            'config_tesseract_path': 'Tesseract OCR Path',
-            'config_browse': 'Browse',
-            'config_validate': 'Validate',
-            'config_save': 'Save',
-            'config_cancel': 'Cancel',
-            'config_no_path': 'Tesseract path not specified!',
-            'config_invalid_path': 'Invalid path: File not found!',
-            'config_validation_success': 'Tesseract OCR {} validated ✓',
-            'config_validation_error': 'Validation error:\n{}',
-            'config_invalid_config_title': 'Invalid Settings',
-            'config_invalid_config_message': 'Please validate the Tesseract path and try again.',
-            'config_select_tesseract': 'Select Tesseract OCR Executable',
-            'error_copy_image_failed': 'Failed to copy image to clipboard:\n{}',
-            'info_copy_not_supported': 'Cannot copy image to clipboard. This feature is not supported on the current platform.',
-            'warning_title': 'Warning',
-            'info_title': 'Info',
-            'error_title': 'Error'
-        }
-    }
+    # Previews above this many pixels are handed to Tk as PPM data, which it copies in a single
+    # pass, instead of going through ImageTk's per-block conversion
+    PPM_MIN_PIXELS = 1_000_000
+
+    # Full quality previews kept for recently used label sizes, so dragging back and forth reuses them
+    PHOTO_CACHE_SIZE = 4
+
+    # Interface texts live in i18n/<language>.json next to this file and are read on first use
+    UI_TEXTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'i18n')
+    _UI_CACHE = {} # language code -> loaded interface texts
+
+    @classmethod
+    def _load_ui_texts(cls, lang_code):
+        """Returns the interface texts for the language, falling back to Turkish if it has no pack."""
+        ui_texts = cls._UI_CACHE.get(lang_code)
+        if ui_texts is None:
+            try:
+                with open(os.path.join(cls.UI_TEXTS_DIR, f'{lang_code}.json'), 'rb') as f:
+                    ui_texts = cls._UI_CACHE[lang_code] = json.loads(f.read())
+            except FileNotFoundError:
+                if lang_code == 'tur':
+                    raise
+                return cls._load_ui_texts('tur')
+        return ui_texts
 
     def __init__(self, root):
         self.root = root
@@ -417,30 +798,47 @@ class MainApplication:
         self.style.theme_use('clam')
 
         self.config = ConfigurationManager.load_config()
-        self.ui_texts = self.UI_TEXTS_BY_LANGUAGE.get(self.config['interface_language'], self.UI_TEXTS_BY_LANGUAGE['tur'])
+        self.ui_texts = self._load_ui_texts(self.config['interface_language'])
         self.language_options = self.ui_texts['language_codes']
 
         self.delay_options = [0, 3, 5, 10]
         self.delay_var = tk.IntVar(value=0)
-        # Initialize language_var with a value that exists in the current language_options
-        # Find the key for the current OCR language (default to first if not found)
-        current_ocr_lang_display = self.ui_texts['ocr_languages'][0] # Default to first ocr language display name
-        self.language_var = tk.StringVar(value=current_ocr_lang_display)
+        # Start on the OCR language used last time, shown by its display name in the interface language
+        self.language_var = tk.StringVar(value=self._ocr_language_display_name())
 
 
         self.captured_image = None
+        self.captured_gray = None
         self.tk_image = None
         self.original_image = None
         self.initial_window_size = "1280x720"
         self.resize_job = None
-
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.final_resize_job = None
+        self._photo_cache = OrderedDict() # (label width, label height, image id) -> LANCZOS PhotoImage, oldest first
+        self._last_cfg_size = None # Image label size seen by the last <Configure> event
+        self.save_config_job = None
+        self._config_dirty = False # In-memory config has changes not yet written to disk
+
+        # OCR is serialized on its own consumer thread: concurrent Tesseract runs only slow each other down,
+        # and image display/clipboard work must not queue behind a long recognition
+        self._ocr_queue = queue.Queue() # (function, args) jobs, None stops the consumer
+        self._ocr_thread = threading.Thread(target=self._ocr_consumer, name='ocr', daemon=True)
+        self._ocr_thread.start()
+        self.ui_executor = ThreadPoolExecutor(max_workers=1)
+        self._ocr_cache = {} # (language code, tesseract path, binarize, psm, oem) -> OCRProcessor
+        self.capturer = ScreenCapturer()
+        self._resources_released = False
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        # Also free the OCR engines if the interpreter exits without the window being closed
+        atexit.register(self._release_resources)
 
         self.create_widgets()
         self.switch_language(self.config['interface_language']) 
-        self.root.bind("<Configure>", self.on_window_resize)
+        # Only the label's own size matters for the preview, the root also reports every child widget
+        self.image_label.bind("<Configure>", self.on_window_resize)
+        # Load the OCR model while the user is still busy capturing
+        self.on_ocr_language_selected()
 
     def _show_message_from_ui_texts(self, msg_func, title_key, message_key, *format_args):
         """Displays a message box with text from UI translations dictionary."""
@@ -452,9 +850,23 @@ class MainApplication:
 
     def on_closing(self):
         """Handles application shutdown by cleaning up resources."""
-        self.executor.shutdown(wait=False)
+        if self._config_dirty: # Flush a language change that is still waiting to be written
+            self._save_config_now()
+        self._release_resources()
         self.root.destroy()
 
+    def _release_resources(self):
+        """Stops the workers and frees the OCR engines and capture handles; safe to call more than once."""
+        if self._resources_released:
+            return
+        self._resources_released = True # From here on no new OCR processors are built
+        # Close the engines on the consumer, behind any job still using them, then stop it
+        self._submit_ocr_job(self._close_cached_ocr_processors)
+        self._ocr_queue.put(None)
+        self.ui_executor.shutdown(wait=False)
+        self.capturer.close()
+        self._ocr_thread.join(timeout=2) # Bounded, so a long recognition cannot hang the exit
+
     def create_widgets(self):
         """Creates and organizes all application UI elements."""
         toolbar = ttk.Frame(self.root)
@@ -470,6 +882,7 @@ class MainApplication:
             toolbar, textvariable=self.language_var, state='readonly', width=10
         )
         self.language_combobox.pack(side='left', padx=5)
+        self.language_combobox.bind("<<ComboboxSelected>>", self.on_ocr_language_selected)
 
         self.delay_label = ttk.Label(toolbar)
         self.delay_label.pack(side='left', padx=5)
@@ -497,13 +910,29 @@ class MainApplication:
 
     def switch_language(self, lang_code):
         """Switches the interface language and updates all UI elements accordingly."""
-        self.ui_texts = self.UI_TEXTS_BY_LANGUAGE.get(lang_code, self.UI_TEXTS_BY_LANGUAGE['tur'])
+        self.ui_texts = self._load_ui_texts(lang_code)
         self.language_options = self.ui_texts['language_codes']
         
-        self.config['interface_language'] = lang_code
-        ConfigurationManager.save_config(self.config)
+        if self.config.get('interface_language') != lang_code: # Nothing to write on startup or re-selection
+            self.config['interface_language'] = lang_code
+            self._schedule_config_save()
         self.update_ui_texts()
 
+    def _schedule_config_save(self):
+        """Saves the configuration after a short delay so rapid changes coalesce into one write."""
+        self._config_dirty = True
+        if self.save_config_job:
+            self.root.after_cancel(self.save_config_job)
+        self.save_config_job = self.root.after(500, self._save_config_now)
+
+    def _save_config_now(self):
+        """Writes the configuration to disk if it changed, cancelling any pending delayed save."""
+        if self.save_config_job:
+            self.root.after_cancel(self.save_config_job)
+            self.save_config_job = None
+        if self._config_dirty:
+            self._config_dirty = not ConfigurationManager.save_config(self.config) # Retried on the next save
+
     def update_ui_texts(self):
         """Updates all UI elements with text from the current language dictionary."""
         ui = self.ui_texts
@@ -518,12 +947,8 @@ class MainApplication:
 
         # Update OCR language combobox values and selection
         self.language_combobox.config(values=ui['ocr_languages'])
-        # Try to keep current selection if possible, or default
-        current_selection = self.language_var.get()
-        if current_selection not in ui['ocr_languages']:
-            self.language_var.set(ui['ocr_languages'][0])
-        else:
-             self.language_var.set(current_selection) # Re-set to ensure it's valid
+        # Display names differ per interface language, so select the saved OCR language by its code
+        self.language_var.set(self._ocr_language_display_name())
 
         # Rebuild menu with new texts
         self.menu.delete(0, 'end')
@@ -546,13 +971,16 @@ class MainApplication:
 
     def show_configuration(self):
         """Displays the configuration dialog and processes the result."""
-        dialog = ConfigurationDialog(self.root, self.config, self.ui_texts)
+        dialog = ConfigurationDialog(self.root, self.config, self.ui_texts, executor=self.ui_executor)
         result = dialog.show()
         if result:
+            if result.get('tesseract_path') != self.config.get('tesseract_path'):
+                # Processors are bound to the old Tesseract path; close them once any running OCR is done
+                self._submit_ocr_job(self._close_ocr_processors, list(self._ocr_cache.values()))
+                self._ocr_cache.clear()
             self.config = result
-            ConfigurationManager.save_config(self.config)
-            # Potentially re-initialize OCRProcessor or update its path if it's an instance variable
-            # For now, OCRProcessor is created on-demand in perform_ocr
+            self._config_dirty = True
+            self._save_config_now() # Settings are saved explicitly, so write right away
 
     def start_capture(self):
         """Initiates the screen capture process with optional delay."""
@@ -561,161 +989,310 @@ class MainApplication:
         if delay > 0:
             self.root.after(delay * 1000, self.capture_process)
         else:
-            # A very small delay can sometimes help ensure the window is fully hidden
-            self.root.after(50, self.capture_process) 
+            # Process the pending withdraw now instead of waiting a fixed 50 ms for it, then leave a
+            # single event loop turn so window managers that repaint asynchronously can catch up
+            self.root.update_idletasks()
+            self.root.after(1, self.capture_process)
 
     def capture_process(self):
         """Executes the actual screen capture operation."""
-        capturer = ScreenCapturer()
-        capturer.capture_screen(self.root, self.process_captured_image)
+        self.capturer.capture_screen(self.root, self.process_captured_image)
 
-    def process_captured_image(self, captured_image):
+    def process_captured_image(self, captured_image, captured_gray=None):
         """Processes and displays the captured image."""
         self.root.deiconify() # Show main window first
         if captured_image:
             self.captured_image = captured_image
-            self.original_image = captured_image.copy()
+            self.captured_gray = captured_gray
+            self.original_image = captured_image # Nothing mutates it in place, no copy needed
+            self._photo_cache.clear()
             self.root.geometry(self.initial_window_size)
-            self.executor.submit(self.display_captured_image, captured_image)
+            self.display_captured_image()
             self.image_button.config(state='normal')
             self.text_button.config(state='normal')
         else:
             self._show_message_from_ui_texts(messagebox.showwarning, 'warning_title', 'warning_screenshot_failed')
 
-    def display_captured_image(self, image):
+    def display_captured_image(self):
         """Prepares the captured image for display in the UI."""
-        self.resize_image() 
-        self.root.after(0, self._update_image_label)
+        self.resize_and_update_image()
 
     def _update_image_label(self):
         """Updates the image label with the currently resized image."""
         self.image_label.configure(image=self.tk_image)
         self.image_label.image = self.tk_image
 
-    def resize_image(self):
-        """Resizes the captured image to fit the display area while maintaining aspect ratio."""
-        if self.original_image is None:
-            return
-
-        label_width = self.image_label.winfo_width()
-        label_height = self.image_label.winfo_height()
+    def resize_image(self, image, label_size, resample=Image.Resampling.LANCZOS):
+        """
+        Resizes an image to fit the display area while maintaining aspect ratio.
+        Only PIL is touched here, so it is safe to call from a worker thread.
 
-        if label_width <= 1 or label_height <= 1:
-            return
+        Args:
+            image: PIL Image object to fit
+            label_size: (width, height) of the image label, read on the Tk thread
+            resample: PIL resampling filter
 
-        original_width, original_height = self.original_image.size
+        Returns:
+            The resized PIL Image, or the image itself if it already fits
+        """
+        label_width, label_height = label_size
+        original_width, original_height = image.size
 
         if original_width <= label_width and original_height <= label_height:
-            resized_image = self.original_image
+            return image
+
+        width_ratio = label_width / original_width
+        height_ratio = label_height / original_height
+        scale_factor = min(width_ratio, height_ratio)
+        new_width = int(original_width * scale_factor)
+        new_height = int(original_height * scale_factor)
+        # Ensure new dimensions are at least 1px
+        new_width = max(1, new_width)
+        new_height = max(1, new_height)
+        # reducing_gap box-reduces large ratios first, so the final filter only runs near the target size
+        return image.resize((new_width, new_height), resample, reducing_gap=2.0)
+
+    def _resize_in_background(self, image, label_size, resample, cache_key):
+        """Resizes the image on the worker thread and hands the result to the Tk thread."""
+        resized_image = self.resize_image(image, label_size, resample)
+        width, height = resized_image.size
+        if width * height > self.PPM_MIN_PIXELS: # Pack the pixels here so the Tk thread only decodes them
+            resized_image = image_to_ppm(resized_image)
+        self.root.after(0, self._install_image, resized_image, resample, cache_key)
+
+    def _install_image(self, resized_image, resample, cache_key):
+        """Creates the PhotoImage on the Tk thread, which is the only thread allowed to call into Tk."""
+        if cache_key[2] != id(self.original_image): # A newer capture replaced the image meanwhile
+            return
+        if isinstance(resized_image, bytes):
+            self.tk_image = tk.PhotoImage(master=self.root, data=resized_image)
         else:
-            width_ratio = label_width / original_width
-            height_ratio = label_height / original_height
-            scale_factor = min(width_ratio, height_ratio)
-            new_width = int(original_width * scale_factor)
-            new_height = int(original_height * scale_factor)
-            # Ensure new dimensions are at least 1px
-            new_width = max(1, new_width)
-            new_height = max(1, new_height)
-            resized_image = self.original_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        self.tk_image = ImageTk.PhotoImage(resized_image)
+            self.tk_image = ImageTk.PhotoImage(resized_image)
+        if resample == Image.Resampling.LANCZOS:
+            self._photo_cache[cache_key] = self.tk_image
+            if len(self._photo_cache) > self.PHOTO_CACHE_SIZE:
+                self._photo_cache.popitem(last=False)
+        self._update_image_label()
 
     def on_window_resize(self, event):
         """Handles window resize events by debouncing and triggering image resizing."""
+        if (event.width, event.height) == self._last_cfg_size: # Configured without changing size
+            return
+        self._last_cfg_size = (event.width, event.height)
         if self.original_image:
             if self.resize_job:
                 self.root.after_cancel(self.resize_job)
+            if self.final_resize_job:
+                self.root.after_cancel(self.final_resize_job)
             self.resize_job = self.root.after(100, self.debounced_resize_and_update_image) # Increased debounce time
+            # High quality pass only once the window has stopped changing size
+            self.final_resize_job = self.root.after(300, self.final_resize_and_update_image)
 
     def debounced_resize_and_update_image(self):
-        """Executes image resize after debounce timeout to avoid excessive processing."""
-        self.resize_and_update_image()
+        """Executes a fast preview resize after debounce timeout to avoid excessive processing."""
+        self.resize_and_update_image(Image.Resampling.BILINEAR)
         self.resize_job = None
 
-    def resize_and_update_image(self):
-        """Performs image resize and schedules UI update."""
-        self.resize_image()
-        if self.tk_image: # Ensure tk_image was created
-            self.root.after(0, self._update_image_label)
+    def final_resize_and_update_image(self):
+        """Re-renders the image with LANCZOS once resizing has settled."""
+        self.resize_and_update_image(Image.Resampling.LANCZOS)
+        self.final_resize_job = None
+
+    def resize_and_update_image(self, resample=Image.Resampling.LANCZOS):
+        """Resizes the image for the current label size on the worker and shows it once ready."""
+        if self.original_image is None:
+            return
+
+        label_size = (self.image_label.winfo_width(), self.image_label.winfo_height())
+        if label_size[0] <= 1 or label_size[1] <= 1:
+            return
+
+        # Reuse the full quality render if the label is back at a size we recently rendered for this image
+        cache_key = (*label_size, id(self.original_image))
+        cached_photo = self._photo_cache.get(cache_key)
+        if cached_photo is not None:
+            self._photo_cache.move_to_end(cache_key)
+            self.tk_image = cached_photo
+            self._update_image_label()
+            return
+
+        self.ui_executor.submit(self._resize_in_background, self.original_image, label_size, resample, cache_key)
 
     @require_capture
     def on_image_button(self):
         """Handles image button click by copying the captured image to clipboard."""
-        self.executor.submit(self.copy_image_to_clipboard)
+        if os.name == 'nt':
+            self.ui_executor.submit(self.copy_image_to_clipboard, self.captured_image)
+        else:
+            # For other platforms, this is often problematic or not supported directly by generic libraries
+            # Pyperclip handles text, not images typically. Tkinter's clipboard_append for images is also limited.
+            self._show_message_from_ui_texts(messagebox.showinfo, 'info_title', 'info_copy_not_supported')
 
     @require_capture
     def on_text_button(self):
         """Handles text button click by extracting and copying text from the image."""
-        self.executor.submit(self.perform_ocr)
+        self.perform_ocr()
 
-    def copy_image_to_clipboard(self):
-        """Copies the captured image to the system clipboard if supported by the platform."""
+    def copy_image_to_clipboard(self, image):
+        """
+        Copies the image to the Windows clipboard on the UI worker. The outcome is shown from the Tk thread,
+        so an open message box does not hold up the preview resizes queued behind it.
+        """
         try:
-            if os.name == 'nt':
-                from io import BytesIO
-                import win32clipboard # This import should ideally be at the top, guarded by os.name check
-                
-                output = BytesIO()
-                # Ensure image is not RGBA if format is BMP which doesn't support alpha well for clipboard
-                image_to_copy = self.captured_image
-                if image_to_copy.mode == 'RGBA':
-                    image_to_copy = image_to_copy.convert('RGB')
-                
-                image_to_copy.save(output, 'BMP')
-                data = output.getvalue()[14:] # Skip BMP header
-                output.close()
-
-                win32clipboard.OpenClipboard()
+            handle = global_alloc_from_chunks(*image_to_dib(image))
+
+            win32clipboard.OpenClipboard()
+            try:
                 win32clipboard.EmptyClipboard()
-                win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
+                win32clipboard.SetClipboardData(win32clipboard.CF_DIB, handle)
+            except Exception:
+                ctypes.windll.kernel32.GlobalFree(ctypes.c_void_p(handle)) # Still ours if the clipboard refused it
+                raise
+            finally:
                 win32clipboard.CloseClipboard()
-                self._show_message_from_ui_texts(messagebox.showinfo, 'info_title', 'info_image_copied')
-            else:
-                # For other platforms, this is often problematic or not supported directly by generic libraries
-                # Pyperclip handles text, not images typically. Tkinter's clipboard_append for images is also limited.
-                self._show_message_from_ui_texts(messagebox.showinfo, 'info_title', 'info_copy_not_supported')
         except Exception as e:
-            self._show_message_from_ui_texts(messagebox.showerror, 'error_title', 'error_copy_image_failed', e)
+            self.root.after(
+                0, self._show_message_from_ui_texts, messagebox.showerror, 'error_title', 'error_copy_image_failed', e
+            )
+        else:
+            self.root.after(0, self._show_message_from_ui_texts, messagebox.showinfo, 'info_title', 'info_image_copied')
+
+    def _submit_ocr_job(self, func, *args):
+        """Queues a call to run on the OCR consumer thread."""
+        self._ocr_queue.put((func, args))
+
+    def _ocr_consumer(self):
+        """
+        Runs queued OCR jobs one at a time on a persistent thread, so every job reuses the loaded models.
+        Jobs that pile up while a recognition runs are taken as one batch, and repeats of the same call
+        (e.g. a double-clicked Text button or a language toggled back and forth) run only once.
+        """
+        while True:
+            jobs = [self._ocr_queue.get()]
+            while True:
+                try:
+                    jobs.append(self._ocr_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            done = set()
+            for job in jobs:
+                if job is None:
+                    return
+                func, args = job
+                job_key = (func, tuple(id(arg) for arg in args)) # Images and arrays are not hashable
+                if job_key in done:
+                    continue
+                done.add(job_key)
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"Error in OCR job: {e}")
+
+    def _close_cached_ocr_processors(self):
+        """Closes and forgets every cached OCR processor; runs on the OCR consumer thread."""
+        ocr_processors = list(self._ocr_cache.values())
+        self._ocr_cache.clear()
+        self._close_ocr_processors(ocr_processors)
+
+    def _close_ocr_processors(self, ocr_processors):
+        """Releases the Tesseract resources held by the given OCR processors."""
+        for ocr_processor in ocr_processors:
+            ocr_processor.close()
+
+    def _get_ocr_processor(self, lang_code):
+        """Returns the cached OCR processor for the language, current Tesseract path and OCR settings."""
+        if self._resources_released: # A processor built now would never be closed
+            raise RuntimeError("OCR has been shut down")
+        tesseract_path = self.config.get('tesseract_path')
+        binarize = self.config.get('preprocess_ocr', True)
+        psm = int(self.config.get('ocr_psm', 6))
+        oem = int(self.config.get('ocr_oem', 1))
+        key = (lang_code, tesseract_path, binarize, psm, oem)
+        ocr_processor = self._ocr_cache.get(key)
+        if ocr_processor is None:
+            ocr_processor = self._ocr_cache.setdefault(
+                key, OCRProcessor(
+                    language=lang_code, tesseract_path=tesseract_path, binarize=binarize, psm=psm, oem=oem
+                )
+            )
+        return ocr_processor
+
+    def _ocr_language_display_name(self):
+        """Returns the display name of the configured OCR language, or the first one if it is not listed."""
+        ocr_lang_code = self.config.get('ocr_language')
+        for display_name, code in self.language_options.items():
+            if code == ocr_lang_code:
+                return display_name
+        return self.ui_texts['ocr_languages'][0]
+
+    def on_ocr_language_selected(self, event=None):
+        """Remembers the selected OCR language and loads its processor in the background, ahead of the next OCR."""
+        ocr_lang_code = self.language_options.get(self.language_var.get(), 'tur') # Tk variables are read on the UI thread
+        if self.config.get('ocr_language') != ocr_lang_code:
+            self.config['ocr_language'] = ocr_lang_code
+            self._schedule_config_save()
+        self._submit_ocr_job(self._prewarm_ocr, ocr_lang_code)
+
+    def _prewarm_ocr(self, ocr_lang_code):
+        """Runs a throwaway recognition so the OCR language data is loaded before the first real request."""
+        if self._resources_released: # Queued before shutdown, nothing left to warm up
+            return
+        try:
+            self._get_ocr_processor(ocr_lang_code).extract_text(Image.new('L', (8, 8), 255))
+        except Exception as e: # Not fatal: a misconfigured Tesseract is reported on the real request
+            print(f"OCR warm-up failed: {e}")
 
     def perform_ocr(self):
-        """Extracts text from the captured image using OCR and copies it to clipboard."""
+        """Starts text extraction on the OCR worker; the result is copied to the clipboard when it arrives."""
+        # Tk state is read here on the UI thread, the worker only gets plain values
+        # language_options maps the display names shown in the combobox to OCR codes, e.g. {'Türkçe': 'tur'}
+        ocr_lang_code = self.language_options.get(self.language_var.get(), 'tur')
+        self._submit_ocr_job(self._run_ocr_worker, self.captured_image, self.captured_gray, ocr_lang_code)
+
+    def _run_ocr_worker(self, image, gray, ocr_lang_code):
+        """Runs OCR on the worker thread and hands the text or the error back to the Tk thread."""
+        if self._resources_released: # Queued before shutdown, the window is already gone
+            return
         try:
-            # Get the OCR language code from the selected display name
-            selected_ocr_display_name = self.language_var.get()
-            ocr_lang_code = 'tur' # Default
-            for display_name, code in self.language_options.items():
-                # This assumes self.language_options maps UI display name to code.
-                # The current setup has self.ui_texts['ocr_languages'] for display and self.ui_texts['language_codes'] for mapping.
-                # We need to map from the display name in combobox to the code.
-                # Example: if combobox shows "Türkçe", we need "tur".
-                # This requires a reverse lookup or a more direct mapping if combobox stored codes.
-                # For simplicity, let's adjust how language_options is used or how combobox is populated.
-                # Current: self.language_options = self.ui_texts['language_codes'] -> {'Türkçe': 'tur', 'İngilizce': 'eng'}
-                # So, this is correct:
-                if selected_ocr_display_name in self.language_options:
-                     ocr_lang_code = self.language_options[selected_ocr_display_name]
-
-            ocr_processor = OCRProcessor(
-                language=ocr_lang_code, 
-                tesseract_path=self.config.get('tesseract_path')
-            )
-            extracted_text = ocr_processor.extract_text(self.captured_image)
-            pyperclip.copy(extracted_text)
+            extracted_text = self._get_ocr_processor(ocr_lang_code).extract_text(image, gray)
+        except Exception as e:
+            self.root.after(0, self._on_ocr_done, None, e)
+        else:
+            self.root.after(0, self._on_ocr_done, extracted_text, None)
+
+    def _copy_text(self, text):
+        """Copies text to the clipboard, in-process through win32clipboard on Windows."""
+        if os.name != 'nt':
+            pyperclip.copy(text)
+            return
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def _on_ocr_done(self, extracted_text, error):
+        """Copies the extracted text to the clipboard and reports the outcome on the Tk thread."""
+        if error is None:
+            try:
+                self._copy_text(extracted_text)
+            except Exception as e:
+                error = e
+        if error is None:
             self._show_message_from_ui_texts(messagebox.showinfo, 'info_title', 'info_text_copied')
-        except pytesseract.pytesseract.TesseractNotFoundError:
+        elif isinstance(error, pytesseract.pytesseract.TesseractNotFoundError):
             self._show_message_from_ui_texts(messagebox.showerror, 'error_title', 'error_tesseract_not_found')
-        except Exception as e:
-            self._show_message_from_ui_texts(messagebox.showerror, 'error_title', 'error_ocr', e)
+        else:
+            self._show_message_from_ui_texts(messagebox.showerror, 'error_title', 'error_ocr', error)
 
     def show_about(self):
        """Displays the about dialog with application information."""
        self._show_message_from_ui_texts(messagebox.showinfo, 'about_title', 'about_message')
 
 if __name__ == '__main__':
-   make_dpi_aware()
-   # Conditional import for win32clipboard if it's only used in one place
-   # However, it's better practice to have imports at the top.
-   # If win32clipboard is Windows-only, the copy_image_to_clipboard already checks os.name.
+   make_dpi_aware() # Before Tk() so the window and screen metrics are created at the real DPI
    root = tk.Tk()
    app = MainApplication(root)
    root.mainloop()
\ No newline at end of file